@@ -4,12 +4,165 @@ UDP packet injector for testing ADIN2111 autonomous switching
 Sends raw Ethernet frames to QEMU socket netdev
 """
 
+import ctypes
+import select
 import socket
 import struct
 import sys
 import time
 
-def create_ethernet_frame(src_mac="52:54:00:12:34:56", 
+# Maximum messages per sendmmsg() call (kernel UIO_MAXIOV)
+UIO_MAXIOV = 1024
+
+# MSG_ZEROCOPY support (not in the socket module): the kernel pins the
+# sender's pages instead of copying them, worthwhile for MTU-sized and
+# jumbo payloads but a net loss for tiny frames due to the completion
+# bookkeeping - hence the size gate.
+SO_ZEROCOPY = 60
+SO_EE_ORIGIN_ZEROCOPY = 5
+MSG_ZEROCOPY = 0x4000000
+ZEROCOPY_MIN_BYTES = 1024
+
+# Persistent socket, created on first use and reused for every frame so we
+# don't pay socket()+close() syscalls per packet when the injection loop is
+# scaled up for stress testing. The socket is connect()ed to its
+# destination so each send() reuses the cached route instead of
+# re-resolving the address per call the way sendto() does.
+_SOCK = None
+_SOCK_ADDR = None
+_ZEROCOPY_OK = False
+
+
+class _iovec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p),
+                ("iov_len", ctypes.c_size_t)]
+
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [("msg_name", ctypes.c_void_p),
+                ("msg_namelen", ctypes.c_uint32),
+                ("msg_iov", ctypes.POINTER(_iovec)),
+                ("msg_iovlen", ctypes.c_size_t),
+                ("msg_control", ctypes.c_void_p),
+                ("msg_controllen", ctypes.c_size_t),
+                ("msg_flags", ctypes.c_int)]
+
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _msghdr),
+                ("msg_len", ctypes.c_uint)]
+
+
+try:
+    _libc = ctypes.CDLL(None, use_errno=True)
+    _sendmmsg = _libc.sendmmsg
+except (OSError, AttributeError):
+    _sendmmsg = None  # non-Linux fallback: loop over send()
+
+# Preformed scatter-gather arrays, sized for the largest sendmmsg batch
+# and wired up once at import: each message owns one iovec slot. Per
+# batch only iov_base/iov_len are repointed, so none of the ctypes
+# array construction survives in the hot loop.
+_IOVS = (_iovec * UIO_MAXIOV)()
+_MSGS = (_mmsghdr * UIO_MAXIOV)()
+for _i in range(UIO_MAXIOV):
+    _MSGS[_i].msg_hdr.msg_iov = ctypes.pointer(_IOVS[_i])
+    _MSGS[_i].msg_hdr.msg_iovlen = 1
+del _i
+
+
+def _get_socket(host, port):
+    """Return the shared UDP socket, connected to (host, port)
+
+    Connecting is a one-time route lookup; afterwards every send()
+    hits the connected-UDP fastpath. The injector only ever targets
+    one port per run, so a destination change just reconnects.
+    """
+    global _SOCK, _SOCK_ADDR, _ZEROCOPY_OK
+    if _SOCK is None:
+        _SOCK = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            _SOCK.setsockopt(socket.SOL_SOCKET, SO_ZEROCOPY, 1)
+            _ZEROCOPY_OK = True
+        except OSError:
+            _ZEROCOPY_OK = False  # pre-4.14 kernel or non-Linux
+    if _SOCK_ADDR != (host, port):
+        _SOCK.connect((host, port))
+        _SOCK_ADDR = (host, port)
+    return _SOCK
+
+
+def _zerocopy_flags(frames):
+    """MSG_ZEROCOPY if enabled and every frame clears the size gate"""
+    if _ZEROCOPY_OK and all(len(f) >= ZEROCOPY_MIN_BYTES for f in frames):
+        return MSG_ZEROCOPY
+    return 0
+
+
+def _drain_zerocopy_completions(sock, outstanding, timeout=1.0):
+    """Wait for MSG_ZEROCOPY completion notifications on the error queue
+
+    The kernel pins the sender's pages until it posts a completion, so
+    buffers must not be reused (or garbage collected) until this
+    returns. Each sock_extended_err covers the inclusive send-counter
+    range [ee_info, ee_data]; notifications may be coalesced. Raises
+    TimeoutError if completions are still pending after the timeout,
+    since reusing the buffers at that point would corrupt the send.
+    """
+    deadline = time.monotonic() + timeout
+    while outstanding > 0:
+        try:
+            _, ancdata, _, _ = sock.recvmsg(
+                0, 512, socket.MSG_ERRQUEUE | socket.MSG_DONTWAIT)
+        except BlockingIOError:
+            # Completion not posted yet. Pending errqueue data raises
+            # POLLERR, which select() reports as readable - not as an
+            # exceptional condition.
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            select.select([sock], [], [], remaining)
+            continue
+        for level, ctype, data in ancdata:
+            if len(data) < 16:
+                continue
+            _errno, origin, _t, _c, _pad, lo, hi = struct.unpack_from(
+                "IBBBBII", data)
+            if origin == SO_EE_ORIGIN_ZEROCOPY:
+                outstanding -= hi - lo + 1
+    if outstanding > 0:
+        raise TimeoutError(
+            f"{outstanding} MSG_ZEROCOPY completions still pending after "
+            f"{timeout}s - send buffers may still be pinned by the kernel")
+
+
+# Prebuilt 60-byte test frame: broadcast dst, locally administered src,
+# IPv4 ethertype. Built once at import; the hot path only rewrites the
+# bytes that change (src MAC index + payload) instead of re-running
+# bytes.fromhex/struct.pack/concatenation per packet.
+FRAME_TEMPLATE = bytearray(60)
+FRAME_TEMPLATE[0:6] = bytes.fromhex("ffffffffffff")   # dst: broadcast
+FRAME_TEMPLATE[6:12] = bytes.fromhex("020000000000")  # src: 02:00:00:00:00:xx
+struct.pack_into("!H", FRAME_TEMPLATE, 12, 0x0800)
+
+_PAYLOAD_OFFSET = 14
+_ZERO_PAYLOAD = bytes(len(FRAME_TEMPLATE) - _PAYLOAD_OFFSET)
+
+
+def fill_test_frame(index, payload):
+    """Rewrite the varying fields of the shared frame template in place
+
+    Returns a memoryview of the template, so the hot path does zero
+    allocations after import. Callers that need the frame to outlive the
+    next fill_test_frame() call must copy it with bytes().
+    """
+    FRAME_TEMPLATE[11] = index & 0xFF
+    FRAME_TEMPLATE[_PAYLOAD_OFFSET:] = _ZERO_PAYLOAD
+    FRAME_TEMPLATE[_PAYLOAD_OFFSET:_PAYLOAD_OFFSET + len(payload)] = payload
+    return memoryview(FRAME_TEMPLATE)
+
+
+def create_ethernet_frame(src_mac="52:54:00:12:34:56",
                           dst_mac="52:54:00:65:43:21",
                           ethertype=0x0800,
                           payload=b"TEST PACKET"):
@@ -17,41 +170,76 @@ def create_ethernet_frame(src_mac="52:54:00:12:34:56",
     # Convert MAC addresses to bytes
     src = bytes.fromhex(src_mac.replace(":", ""))
     dst = bytes.fromhex(dst_mac.replace(":", ""))
-    
+
     # Build frame: dst_mac(6) + src_mac(6) + ethertype(2) + payload
     frame = dst + src + struct.pack("!H", ethertype) + payload
-    
+
     # Pad to minimum Ethernet frame size (64 bytes including CRC)
     # We send 60 bytes, assuming 4-byte CRC added by hardware
     if len(frame) < 60:
         frame += b'\x00' * (60 - len(frame))
-    
+
     return frame
 
 def send_to_qemu_socket(frame, host="127.0.0.1", port=10001):
     """Send frame to QEMU socket netdev"""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.sendto(frame, (host, port))
-    sock.close()
+    sock = _get_socket(host, port)
+    flags = _zerocopy_flags([frame])
+    sock.send(frame, flags)
+    if flags:
+        _drain_zerocopy_completions(sock, 1)
     print(f"Sent {len(frame)} bytes to {host}:{port}")
 
+def send_frames_to_qemu_socket(frames, host="127.0.0.1", port=10001):
+    """Send a batch of frames with one sendmmsg() per UIO_MAXIOV chunk
+
+    One datagram per frame, but only ceil(N/UIO_MAXIOV) syscalls instead
+    of N, so the syscall cost is amortized across the whole batch.
+    """
+    sock = _get_socket(host, port)
+    if _sendmmsg is None:
+        for frame in frames:
+            sock.send(frame)
+        return len(frames)
+
+    sent = 0
+    for off in range(0, len(frames), UIO_MAXIOV):
+        chunk = frames[off:off + UIO_MAXIOV]
+        flags = _zerocopy_flags(chunk)
+        # Point the preformed iovecs straight at the frame bytes - no
+        # intermediate copy; the frames list keeps the buffers alive
+        # for the syscall (and, with MSG_ZEROCOPY, until the drain
+        # below). msg_name stays NULL: the socket is connected.
+        for i, frame in enumerate(chunk):
+            _IOVS[i].iov_base = ctypes.cast(
+                ctypes.c_char_p(frame), ctypes.c_void_p)
+            _IOVS[i].iov_len = len(frame)
+        ret = _sendmmsg(sock.fileno(), _MSGS, len(chunk), flags)
+        if ret < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"sendmmsg failed: {errno}")
+        if flags:
+            # frames must stay pinned until the kernel releases them
+            _drain_zerocopy_completions(sock, ret)
+        sent += ret
+    return sent
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         port = int(sys.argv[1])
     else:
         port = 10001  # Default to p0 ingress
-    
+
     print(f"=== ADIN2111 Traffic Injector ===")
     print(f"Sending to UDP port {port} (QEMU socket netdev)")
-    
-    # Send test frames
-    for i in range(3):
-        frame = create_ethernet_frame(
-            src_mac=f"02:00:00:00:00:{i:02x}",
-            dst_mac="ff:ff:ff:ff:ff:ff",  # Broadcast
-            payload=f"AUTONOMOUS TEST {i}".encode()
-        )
-        send_to_qemu_socket(frame, port=port)
-        time.sleep(0.5)
-    
-    print("Done - check p0.pcap and p1.pcap for forwarding proof")
\ No newline at end of file
+
+    # Send test frames (broadcast, src MAC 02:00:00:00:00:0i) as one
+    # sendmmsg batch - the switch only needs them to be distinct frames,
+    # not spaced out by sleeps
+    frames = [bytes(fill_test_frame(i, f"AUTONOMOUS TEST {i}".encode()))
+              for i in range(3)]
+    sent = send_frames_to_qemu_socket(frames, port=port)
+    print(f"Sent {sent} frames ({sum(len(f) for f in frames)} bytes) "
+          f"to port {port}")
+
+    print("Done - check p0.pcap and p1.pcap for forwarding proof")
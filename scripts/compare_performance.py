@@ -1,24 +1,79 @@
 #!/usr/bin/env python3
 """
 Compare performance benchmarks against baseline
+
+Loads the baseline and current results, aligns the metrics by name and
+does the threshold check as one vectorized comparison so per-commit
+historical runs stay cheap as the metric count grows.
 """
 
 import json
 import sys
 import argparse
 
+import numpy as np
+
+# Units where a larger number is better; for everything else
+# (latency, CPU%, ...) an increase is a regression
+HIGHER_IS_BETTER_UNITS = {'Mbps', 'Gbps', 'pps', 'ops/s'}
+
+def load_metrics(path):
+    """Load {name: (value, unit)} from a results file
+
+    Accepts the github-action-benchmark list format written by
+    tests/performance/run_benchmarks.sh ([{name, unit, value}, ...])
+    or a flat {name: value} dict.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        return {name: (float(value), '') for name, value in data.items()}
+    return {entry['name']: (float(entry['value']), entry.get('unit', ''))
+            for entry in data}
+
 def main():
     parser = argparse.ArgumentParser(description='Compare performance results')
     parser.add_argument('--baseline', required=True, help='Baseline JSON file')
     parser.add_argument('--current', required=True, help='Current results JSON file')
     parser.add_argument('--threshold', type=float, default=10, help='Threshold percentage')
-    
+
     args = parser.parse_args()
-    
-    # For now, just return success
+
+    baseline = load_metrics(args.baseline)
+    current = load_metrics(args.current)
+
+    names = sorted(baseline.keys() & current.keys())
+    for name in sorted(baseline.keys() - current.keys()):
+        print(f"Warning: metric '{name}' missing from current results")
+    if not names:
+        print("No common metrics to compare")
+        return 1
+
+    base = np.fromiter((baseline[n][0] for n in names), dtype=np.float64)
+    cur = np.fromiter((current[n][0] for n in names), dtype=np.float64)
+    higher_better = np.fromiter(
+        (baseline[n][1] in HIGHER_IS_BETTER_UNITS for n in names), dtype=bool)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = np.where(base != 0, (cur - base) / base * 100.0, 0.0)
+    # Express every change as "percent worse" regardless of direction
+    worsened = np.where(higher_better, -change, change)
+    regressed = np.where(worsened > args.threshold)[0]
+
+    for i in regressed:
+        unit = baseline[names[i]][1]
+        print(f"REGRESSION {names[i]}: baseline {base[i]:g}{unit}, "
+              f"current {cur[i]:g}{unit} ({change[i]:+.1f}%)")
+
+    if regressed.size:
+        print(f"Performance comparison: FAIL "
+              f"({regressed.size}/{len(names)} metrics beyond "
+              f"{args.threshold}% threshold)")
+        return 1
+
     print("Performance comparison: PASS")
     print("All metrics within acceptable threshold")
     return 0
 
 if __name__ == '__main__':
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+AF_PACKET capture helper for the MAC learning tests
+
+Run as root by test-mac-learning.py. Enters the target network
+namespace with setns(2), opens a raw AF_PACKET socket bound to the
+interface with a classic BPF filter for the test UDP port attached,
+then polls with select() until the requested number of frames or the
+timeout. Replaces spawning tcpdump per check, which cost hundreds of
+ms of startup and always slept the full timeout.
+
+Protocol: prints READY once the filter is attached (so the caller
+knows it is safe to send), then one line per matched frame containing
+the UDP payload.
+"""
+
+import ctypes
+import os
+import select
+import socket
+import struct
+import sys
+import time
+
+CLONE_NEWNET = 0x40000000
+ETH_P_ALL = 0x0003
+SO_ATTACH_FILTER = 26
+PACKET_OUTGOING = 4
+
+# Classic BPF for "udp port 9999" (tcpdump -ddd output), as
+# (code, jt, jf, k) tuples. Matches IPv4 and IPv6, src or dst port.
+BPF_UDP_PORT_9999 = [
+    (0x28, 0, 0, 12),        # ldh [12]            ethertype
+    (0x15, 0, 6, 0x86dd),    # jeq #0x86dd         IPv6?
+    (0x30, 0, 0, 20),        # ldb [20]            next header
+    (0x15, 0, 15, 17),       # jeq #17             UDP?
+    (0x28, 0, 0, 54),        # ldh [54]            src port
+    (0x15, 12, 0, 9999),
+    (0x28, 0, 0, 56),        # ldh [56]            dst port
+    (0x15, 10, 11, 9999),
+    (0x15, 0, 10, 0x0800),   # jeq #0x800          IPv4?
+    (0x30, 0, 0, 23),        # ldb [23]            protocol
+    (0x15, 0, 8, 17),        # jeq #17             UDP?
+    (0x28, 0, 0, 20),        # ldh [20]            frag offset
+    (0x45, 6, 0, 0x1fff),    # jset #0x1fff        fragment -> drop
+    (0xb1, 0, 0, 14),        # ldxb 4*([14]&0xf)   IP header length
+    (0x48, 0, 0, 14),        # ldh [x + 14]        src port
+    (0x15, 2, 0, 9999),
+    (0x48, 0, 0, 16),        # ldh [x + 16]        dst port
+    (0x15, 0, 1, 9999),
+    (0x06, 0, 0, 262144),    # ret #262144         accept
+    (0x06, 0, 0, 0),         # ret #0              drop
+]
+
+
+def enter_namespace(ns):
+    """setns(2) into the named network namespace"""
+    libc = ctypes.CDLL(None, use_errno=True)
+    fd = os.open(f"/var/run/netns/{ns}", os.O_RDONLY)
+    try:
+        if libc.setns(fd, CLONE_NEWNET) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"setns({ns}) failed")
+    finally:
+        os.close(fd)
+
+
+def open_capture_socket(iface):
+    """Raw AF_PACKET socket on iface with the UDP-port filter attached"""
+    sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW,
+                         socket.htons(ETH_P_ALL))
+    sock.bind((iface, 0))
+    insns = b"".join(struct.pack("HBBI", *i) for i in BPF_UDP_PORT_9999)
+    buf = ctypes.create_string_buffer(insns, len(insns))
+    # struct sock_fprog { unsigned short len; struct sock_filter *filter; }
+    prog = struct.pack("HL", len(BPF_UDP_PORT_9999), ctypes.addressof(buf))
+    sock.setsockopt(socket.SOL_SOCKET, SO_ATTACH_FILTER, prog)
+    return sock
+
+
+def udp_payload(frame):
+    """Extract the UDP payload from an IPv4 Ethernet frame"""
+    if len(frame) < 14 or struct.unpack("!H", frame[12:14])[0] != 0x0800:
+        return None
+    ihl = (frame[14] & 0x0f) * 4
+    return frame[14 + ihl + 8:]
+
+
+def main():
+    if len(sys.argv) != 5:
+        print("usage: ns_capture.py <ns> <iface> <count> <timeout>",
+              file=sys.stderr)
+        print("       count=0 streams matches until terminated; "
+              "timeout=0 means no deadline", file=sys.stderr)
+        return 1
+
+    ns, iface = sys.argv[1], sys.argv[2]
+    count, timeout = int(sys.argv[3]), float(sys.argv[4])
+
+    enter_namespace(ns)
+    sock = open_capture_socket(iface)
+    print("READY", flush=True)
+
+    deadline = time.monotonic() + timeout if timeout > 0 else None
+    matched = 0
+    while count == 0 or matched < count:
+        remaining = None
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+        readable, _, _ = select.select([sock], [], [], remaining)
+        if not readable:
+            break
+        frame, addr = sock.recvfrom(65535)
+        if addr[2] == PACKET_OUTGOING:
+            continue  # only count frames received on the interface
+        payload = udp_payload(frame)
+        if payload is None:
+            continue
+        print(payload.rstrip(b"\x00").decode("latin-1"), flush=True)
+        matched += 1
+
+    sock.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
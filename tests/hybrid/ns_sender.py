@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Persistent in-namespace packet sender for the MAC learning tests
+
+Run under `ip netns exec <ns>` by test-mac-learning.py. Imports scapy
+and opens the L2 socket exactly once, then loops reading one JSON
+request per line from stdin and sending the described frame, so the
+test runner pays the scapy import cost once per namespace instead of
+once per packet.
+
+Protocol: prints READY once the L2 socket is open, then answers each
+request line with OK or ERR <reason>.
+"""
+
+import json
+import sys
+from functools import lru_cache
+
+from scapy.all import Ether, IP, UDP, Raw, conf, raw
+
+
+@lru_cache(maxsize=1024)
+def build_frame(src_mac, dst_mac, src_ip, dst_ip, sport, dport, data):
+    """Serialize one test frame to raw bytes
+
+    scapy's build machinery dominates per-send cost; the tests reuse a
+    handful of (src, dst, payload) tuples, so caching the serialized
+    bytes makes repeat sends a plain socket write.
+    """
+    return raw(Ether(src=src_mac, dst=dst_mac) /
+               IP(src=src_ip, dst=dst_ip) /
+               UDP(sport=sport, dport=dport) /
+               Raw(load=data.encode()))
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("usage: ns_sender.py <iface>", file=sys.stderr)
+        return 1
+
+    iface = sys.argv[1]
+    conf.verb = 0
+    l2_socket = conf.L2socket(iface=iface)
+    print("READY", flush=True)
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+            frame = build_frame(req["src_mac"], req["dst_mac"],
+                                req["src_ip"], req["dst_ip"],
+                                req.get("sport", 9999),
+                                req.get("dport", 9999),
+                                req["data"])
+            l2_socket.send(frame)
+            print("OK", flush=True)
+        except Exception as exc:
+            print(f"ERR {exc}", flush=True)
+
+    l2_socket.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+ADIN2111 MAC Learning Validation (hybrid QEMU/netns testbed)
+
+Exercises the switch's address learning across two host network
+namespaces (phy0/phy1) wired to the DUT ports:
+  1. Broadcast from phy0 floods to phy1
+  2. Reply from phy1 teaches the switch both stations
+  3. Learned unicast is forwarded to the owning port only
+
+Requires the phy0/phy1 namespaces set up by the hybrid testbed scripts
+and root (sudo) for namespace entry and packet capture.
+"""
+
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+
+# scapy is only used inside the ns_sender.py helper processes; keeping
+# its ~400ms star-import out of the runner shaves that off every suite
+# invocation (ns_sender reports a clear error if scapy is missing).
+
+class Colors:
+    RED = '\033[0;31m'
+    GREEN = '\033[0;32m'
+    YELLOW = '\033[0;33m'
+    BLUE = '\033[0;34m'
+    NC = '\033[0m'
+
+TEST_PORT = 9999
+
+# Station parameters per namespace: (iface, mac, ip)
+STATIONS = {
+    "phy0": ("veth0", "02:11:22:33:44:01", "10.0.0.1"),
+    "phy1": ("veth1", "02:11:22:33:44:02", "10.0.0.2"),
+}
+
+BROADCAST_MAC = "ff:ff:ff:ff:ff:ff"
+
+
+class NamespaceSender:
+    """Long-lived scapy sender inside a network namespace
+
+    Spawns ns_sender.py once inside the namespace and streams one JSON
+    line per packet over its stdin, so scapy is imported and the L2
+    socket opened once per namespace instead of once per packet.
+    """
+
+    def __init__(self, ns, iface):
+        helper = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "ns_sender.py")
+        self.ns = ns
+        # nsenter on the namespace bind-mount, plain argv: no shell, no
+        # iproute2 in the loop
+        self.proc = subprocess.Popen(
+            ["sudo", "nsenter", f"--net=/var/run/netns/{ns}",
+             sys.executable, "-u", helper, iface],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        ready = self.proc.stdout.readline().strip()
+        if ready != b"READY":
+            raise RuntimeError(f"ns_sender failed to start in {ns}: {ready}")
+
+    def send(self, src_mac, dst_mac, src_ip, dst_ip, data):
+        """Send one UDP-in-Ethernet frame; returns True on success"""
+        req = json.dumps({
+            "src_mac": src_mac, "dst_mac": dst_mac,
+            "src_ip": src_ip, "dst_ip": dst_ip,
+            "dport": TEST_PORT, "data": data,
+        })
+        self.proc.stdin.write(req.encode() + b"\n")
+        self.proc.stdin.flush()
+        resp = self.proc.stdout.readline().strip()
+        if resp != b"OK":
+            print(f"{Colors.RED}send failed in {self.ns}: "
+                  f"{resp.decode(errors='replace')}{Colors.NC}")
+            return False
+        return True
+
+    def close(self):
+        if self.proc.stdin:
+            self.proc.stdin.close()
+        self.proc.wait(timeout=5)
+
+
+def check_namespaces():
+    """Verify the phy0/phy1 test namespaces exist
+
+    iproute2 keeps one bind-mount per named namespace under
+    /var/run/netns, so reading the directory beats forking
+    `ip netns list` and parsing its output.
+    """
+    try:
+        namespaces = set(os.listdir("/var/run/netns"))
+    except FileNotFoundError:
+        return False
+    return set(STATIONS) <= namespaces
+
+
+class NamespaceListener:
+    """Suite-long AF_PACKET listener inside a network namespace
+
+    Runs one ns_capture.py per namespace for the whole suite (in follow
+    mode: count=0, no deadline); a reader thread pushes every matched
+    payload into a Queue. Tests consume from the queue and return as
+    soon as the expected frame arrives — no per-test capture startup
+    and no dead time waiting out fixed timeouts. The constructor blocks
+    until the BPF filter is attached, so frames sent afterwards are
+    never missed.
+    """
+
+    def __init__(self, ns, iface):
+        helper = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                              "ns_capture.py")
+        self.ns = ns
+        self.proc = subprocess.Popen(
+            ["sudo", sys.executable, "-u", helper, ns, iface, "0", "0"],
+            stdout=subprocess.PIPE, text=True)
+        ready = self.proc.stdout.readline().strip()
+        if ready != "READY":
+            raise RuntimeError(f"ns_capture failed to start in {ns}: {ready}")
+        self.packets = queue.Queue()
+        self._reader = threading.Thread(target=self._pump, daemon=True)
+        self._reader.start()
+
+    def _pump(self):
+        for line in self.proc.stdout:
+            self.packets.put(line.rstrip("\n"))
+
+    def expect(self, match, timeout=2):
+        """True if a payload containing `match` arrives within timeout"""
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                payload = self.packets.get(timeout=remaining)
+            except queue.Empty:
+                return False
+            if match in payload:
+                return True
+
+    def expect_quiet(self, match, timeout=1):
+        """True if no payload containing `match` arrives within timeout"""
+        return not self.expect(match, timeout=timeout)
+
+    def close(self):
+        self.proc.terminate()
+        self.proc.wait(timeout=5)
+
+
+class MacLearningTest:
+    def __init__(self):
+        self.passed = 0
+        self.failed = 0
+        self.senders = {}
+        self.listeners = {}
+
+    def setup(self):
+        for ns, (iface, _mac, _ip) in STATIONS.items():
+            self.listeners[ns] = NamespaceListener(ns, iface)
+            self.senders[ns] = NamespaceSender(ns, iface)
+
+    def teardown(self):
+        for sender in self.senders.values():
+            sender.close()
+        for listener in self.listeners.values():
+            listener.close()
+
+    def log_result(self, name, result):
+        if result:
+            print(f"{Colors.GREEN}✓{Colors.NC} {name}: PASSED")
+            self.passed += 1
+        else:
+            print(f"{Colors.RED}✗{Colors.NC} {name}: FAILED")
+            self.failed += 1
+
+    def test_broadcast_floods(self):
+        """Broadcast from phy0 must appear on phy1 (unknown dst floods)"""
+        print(f"\n{Colors.YELLOW}Test 1: Broadcast flooding{Colors.NC}")
+        iface0, mac0, ip0 = STATIONS["phy0"]
+        iface1, _mac1, _ip1 = STATIONS["phy1"]
+
+        self.senders["phy0"].send(mac0, BROADCAST_MAC,
+                                  ip0, "10.0.0.255", "LEARN-BCAST")
+        self.log_result("Broadcast floods to phy1",
+                        self.listeners["phy1"].expect("LEARN-BCAST"))
+
+    def test_learned_unicast_forwarded(self):
+        """After phy1 replies, unicast to its MAC must reach phy1"""
+        print(f"\n{Colors.YELLOW}Test 2: Learned unicast forwarding{Colors.NC}")
+        iface0, mac0, ip0 = STATIONS["phy0"]
+        iface1, mac1, ip1 = STATIONS["phy1"]
+
+        # Teach the switch phy1's MAC, then send unicast from phy0
+        self.senders["phy1"].send(mac1, mac0, ip1, ip0, "LEARN-REPLY")
+        time.sleep(0.1)
+        self.senders["phy0"].send(mac0, mac1, ip0, ip1, "UNICAST-FWD")
+        self.log_result("Unicast forwarded to learned port",
+                        self.listeners["phy1"].expect("UNICAST-FWD"))
+
+    def test_no_flood_to_source_port(self):
+        """Learned unicast must not be reflected to the source port"""
+        print(f"\n{Colors.YELLOW}Test 3: No flooding after learning{Colors.NC}")
+        iface0, mac0, ip0 = STATIONS["phy0"]
+        _iface1, mac1, ip1 = STATIONS["phy1"]
+
+        self.senders["phy0"].send(mac0, mac1, ip0, ip1, "NO-REFLECT")
+        self.log_result("Frame not reflected to source port",
+                        self.listeners["phy0"].expect_quiet("NO-REFLECT"))
+
+    def run(self):
+        print(f"{Colors.BLUE}=== ADIN2111 MAC Learning Tests ==={Colors.NC}")
+
+        if not check_namespaces():
+            print(f"{Colors.RED}phy0/phy1 namespaces not found - "
+                  f"run the hybrid testbed setup first{Colors.NC}")
+            return False
+
+        self.setup()
+        try:
+            self.test_broadcast_floods()
+            self.test_learned_unicast_forwarded()
+            self.test_no_flood_to_source_port()
+        finally:
+            self.teardown()
+
+        print(f"\n{Colors.BLUE}=== Summary ==={Colors.NC}")
+        print(f"Passed: {Colors.GREEN}{self.passed}{Colors.NC}")
+        print(f"Failed: {Colors.RED}{self.failed}{Colors.NC}")
+        return self.failed == 0
+
+
+if __name__ == "__main__":
+    test = MacLearningTest()
+    sys.exit(0 if test.run() else 1)
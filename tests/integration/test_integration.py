@@ -1,27 +1,96 @@
 #!/usr/bin/env python3
 """
 Integration tests for ADIN2111 driver
+
+All cases share one session-scoped driver load/unload, so adding cases
+doesn't multiply the seconds-long modprobe cost, and pytest-xdist can
+still shard the parameterized cases across workers.
 """
 
+import os
+import subprocess
 import sys
+
 import pytest
 
-def test_network_connectivity():
-    """Test basic network connectivity"""
-    assert True, "Network connectivity test placeholder"
 
-def test_driver_loading():
-    """Test driver loading in container"""
-    assert True, "Driver loading test placeholder"
+@pytest.fixture(scope="session")
+def driver():
+    """Load the adin2111 module once for the whole session"""
+    try:
+        result = subprocess.run(["modprobe", "adin2111"],
+                                capture_output=True)
+    except FileNotFoundError:
+        pytest.skip("modprobe not available on this host")
+    if result.returncode != 0:
+        pytest.skip("adin2111 module not available on this host")
+    yield
+    subprocess.run(["rmmod", "adin2111"], capture_output=True)
+
+
+def _adin_interfaces():
+    """Network interfaces bound to the adin2111 driver"""
+    interfaces = []
+    for iface in os.listdir("/sys/class/net"):
+        driver_link = f"/sys/class/net/{iface}/device/driver"
+        if os.path.islink(driver_link) and \
+                os.path.basename(os.readlink(driver_link)) == "adin2111":
+            interfaces.append(iface)
+    return interfaces
+
+
+def _check_driver_loading():
+    """Module is registered after modprobe"""
+    with open("/proc/modules") as f:
+        assert "adin2111" in f.read(), "adin2111 missing from /proc/modules"
+
+
+def _check_network_connectivity():
+    """Driver exposes at least one interface that can be brought up"""
+    interfaces = _adin_interfaces()
+    assert interfaces, "no network interface bound to adin2111"
+    for iface in interfaces:
+        with open(f"/sys/class/net/{iface}/operstate") as f:
+            assert f.read().strip() in ("up", "down", "unknown")
+
+
+def _check_data_transfer():
+    """TX/RX statistics are exposed and readable"""
+    interfaces = _adin_interfaces()
+    assert interfaces, "no network interface bound to adin2111"
+    for iface in interfaces:
+        for counter in ("tx_bytes", "rx_bytes", "tx_packets", "rx_packets"):
+            with open(f"/sys/class/net/{iface}/statistics/{counter}") as f:
+                assert int(f.read()) >= 0
+
+
+def _check_error_handling():
+    """Error counters are exposed and invalid MTU writes are rejected"""
+    interfaces = _adin_interfaces()
+    assert interfaces, "no network interface bound to adin2111"
+    for iface in interfaces:
+        for counter in ("tx_errors", "rx_errors", "tx_dropped", "rx_dropped"):
+            with open(f"/sys/class/net/{iface}/statistics/{counter}") as f:
+                assert int(f.read()) >= 0
+        result = subprocess.run(
+            ["ip", "link", "set", iface, "mtu", "99999"],
+            capture_output=True)
+        assert result.returncode != 0, "oversized MTU was accepted"
+
+
+CASES = {
+    "loading": _check_driver_loading,
+    "connectivity": _check_network_connectivity,
+    "transfer": _check_data_transfer,
+    "errors": _check_error_handling,
+}
+
 
-def test_data_transfer():
-    """Test data transfer functionality"""
-    assert True, "Data transfer test placeholder"
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_driver(driver, case):
+    CASES[case]()
 
-def test_error_handling():
-    """Test error handling scenarios"""
-    assert True, "Error handling test placeholder"
 
 if __name__ == "__main__":
     # Run tests with pytest
-    sys.exit(pytest.main([__file__, "-v"]))
\ No newline at end of file
+    sys.exit(pytest.main([__file__, "-v"]))